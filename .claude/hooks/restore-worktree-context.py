@@ -6,7 +6,7 @@ After compaction, injects git state context so Claude knows where it is.
 This prevents context drift where Claude forgets which worktree/branch it's in.
 
 Only fires when source is "compact" (not on startup, resume, or clear).
-Reads state from .claude/settings.local.json (worktreeState key).
+Reads state from .claude/worktree-state.local.json.
 
 Output (on success):
 - JSON with additionalContext containing git state summary
@@ -22,30 +22,55 @@ import os
 import subprocess
 import sys
 
+STATE_FILENAME = "worktree-state.local.json"
+
+
+def is_same_directory(current: str, saved: str) -> bool:
+    """Check whether two paths point at the same directory.
+
+    Compares device and inode (one stat per path) rather than resolving every
+    path component. Falls back to a string compare if either path is gone.
+    """
+    try:
+        return os.path.samefile(current, saved)
+    except OSError:
+        return current.rstrip("/") == saved.rstrip("/")
+
 
 def main():
+    raw_input = sys.stdin.buffer.read()
+    if not raw_input.strip():
+        sys.exit(0)
+
     try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
+        input_data = json.loads(raw_input)
+    except (json.JSONDecodeError, UnicodeDecodeError):
         sys.exit(0)
 
     # Only fire after compaction
     if input_data.get("source") != "compact":
         sys.exit(0)
 
-    cwd = input_data.get("cwd", str(Path.cwd()))
+    cwd = input_data.get("cwd") or os.getcwd()
 
-    # Try to find settings.local.json
+    # Try to find the saved state
     # Check cwd first, then check if we can find main repo's .claude
-    settings_file = Path(cwd) / ".claude" / "settings.local.json"
+    state_file = Path(cwd) / ".claude" / STATE_FILENAME
 
-    if not settings_file.exists():
-        # If we're in a worktree, the settings file is in main repo
+    if not state_file.exists():
+        # If we're in a worktree, the state file is in main repo
         # Try to find it via git rev-parse --git-common-dir
         try:
             result = subprocess.run(
-                ["git", "rev-parse", "--git-common-dir"],  # noqa: S607
+                [  # noqa: S607
+                    "git",
+                    "--no-optional-locks",
+                    "--no-pager",
+                    "rev-parse",
+                    "--git-common-dir",
+                ],
                 check=False,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 cwd=cwd,
@@ -53,24 +78,30 @@ def main():
             if result.returncode == 0:
                 git_common_dir = Path(result.stdout.strip()).resolve()
                 main_repo = git_common_dir.parent
-                settings_file = main_repo / ".claude" / "settings.local.json"
+                state_file = main_repo / ".claude" / STATE_FILENAME
         except (subprocess.SubprocessError, FileNotFoundError):
             pass
 
-    if not settings_file.exists():
+    if not state_file.exists():
         sys.exit(0)
 
     try:
-        settings = json.loads(settings_file.read_text())
-        state = settings.get("worktreeState")
+        state = json.loads(state_file.read_text())
         if not state:
             sys.exit(0)
     except (OSError, json.JSONDecodeError):
         sys.exit(0)
 
-    # Build context message
+    # Build context message, drift warning first so it's the first thing read
     lines = ["## Git State (restored after compaction)"]
 
+    # Check if current cwd differs from saved state (drift detection)
+    if state.get("cwd") and not is_same_directory(cwd, state.get("cwd")):
+        lines.append("\n**WARNING: You may have drifted!**")
+        lines.append(f"- Saved location: `{state.get('cwd')}`")
+        lines.append(f"- Current location: `{cwd}`")
+        lines.append(f"- Consider: `cd {state.get('cwd')}`\n")
+
     if state.get("is_worktree"):
         lines.append("**You are in a WORKTREE** - not the main repo!")
         lines.append(f"- Worktree path: `{state.get('cwd')}`")
@@ -85,13 +116,6 @@ def main():
     if state.get("recent_commits"):
         lines.append(f"\n**Recent commits:**\n```\n{state.get('recent_commits')}\n```")
 
-    # Check if current cwd differs from saved state (drift detection)
-    if state.get("cwd") and os.path.realpath(cwd) != os.path.realpath(state.get("cwd")):
-        lines.insert(1, "\n**WARNING: You may have drifted!**")
-        lines.insert(2, f"- Saved location: `{state.get('cwd')}`")
-        lines.insert(3, f"- Current location: `{cwd}`")
-        lines.insert(4, f"- Consider: `cd {state.get('cwd')}`\n")
-
     context = "\n".join(lines)
 
     # Output JSON with additionalContext
@@ -5,7 +5,7 @@ Claude Code Hook: Save Worktree State (PreCompact)
 Saves git state before compaction so it can be restored after.
 This prevents context drift where Claude forgets which worktree/branch it's in.
 
-Saves to .claude/settings.local.json (worktreeState key):
+Saves to .claude/worktree-state.local.json:
 - Current working directory
 - Git branch name
 - Whether we're in a worktree
@@ -19,16 +19,22 @@ Exit codes:
 
 from pathlib import Path
 import json
+import os
 import subprocess
 import sys
 
+STATE_FILENAME = "worktree-state.local.json"
+
 
 def run_git(args: list[str], cwd: str) -> str:
     """Run a git command and return stdout, or empty string on failure."""
     try:
+        # --no-optional-locks keeps `git status` from taking index.lock, so we
+        # never contend with git commands running in parallel worktrees
         result = subprocess.run(  # noqa: S603
-            ["git", *args],  # noqa: S607
+            ["git", "--no-optional-locks", "--no-pager", *args],  # noqa: S607
             check=False,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
             cwd=cwd,
@@ -38,6 +44,25 @@ def run_git(args: list[str], cwd: str) -> str:
         return ""
 
 
+def get_branch_and_status(cwd: str) -> tuple[str, str]:
+    """Get the current branch and short status from a single git call.
+
+    `git status --branch` prefixes the short status with a `## <branch>...`
+    header, so we don't need a separate `git branch --show-current`.
+    """
+    header, _, status = run_git(["status", "--short", "--branch"], cwd).partition("\n")
+    head = header.removeprefix("## ")
+
+    if head.startswith("HEAD (no branch)"):
+        # Detached HEAD - match `git branch --show-current`, which prints nothing
+        return "", status
+    for unborn_prefix in ("No commits yet on ", "Initial commit on "):
+        if head.startswith(unborn_prefix):
+            return head.removeprefix(unborn_prefix), status
+    # "main...origin/main [ahead 1]" - ".." can't appear in a branch name
+    return head.split("...", 1)[0], status
+
+
 def is_worktree(cwd: str) -> bool:
     """Check if we're in a git worktree (not the main repo)."""
     git_dir = Path(cwd) / ".git"
@@ -46,51 +71,68 @@ def is_worktree(cwd: str) -> bool:
 
 
 def get_main_repo_path(cwd: str) -> str:
-    """Get the main repository path if we're in a worktree."""
+    """Get the main repository path if we're in a worktree.
+
+    A worktree's .git file points at `<main>/.git/worktrees/<name>`, whose
+    `commondir` file points back at the shared `<main>/.git`. Reading those two
+    files saves spawning `git rev-parse --git-common-dir`.
+    """
+    try:
+        pointer = (Path(cwd) / ".git").read_text().strip()
+        if pointer.startswith("gitdir: "):
+            git_dir = Path(cwd) / pointer.removeprefix("gitdir: ")
+            common_dir = git_dir / (git_dir / "commondir").read_text().strip()
+            return str(common_dir.resolve().parent)
+    except OSError:
+        pass
+
     git_common_dir = run_git(["rev-parse", "--git-common-dir"], cwd)
     if git_common_dir:
-        return str(Path(git_common_dir).resolve().parent)
+        # May be relative to cwd (e.g. ".git"), so don't resolve it against ours
+        return str((Path(cwd) / git_common_dir).resolve().parent)
     return ""
 
 
 def main():
+    raw_input = sys.stdin.buffer.read()
+    if not raw_input.strip():
+        sys.exit(0)
+
     try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
+        input_data = json.loads(raw_input)
+    except (json.JSONDecodeError, UnicodeDecodeError):
         sys.exit(0)
 
-    cwd = input_data.get("cwd", str(Path.cwd()))
+    cwd = input_data.get("cwd") or os.getcwd()
 
     # Gather git state
+    branch, status = get_branch_and_status(cwd)
+    in_worktree = is_worktree(cwd)
     state = {
         "cwd": cwd,
-        "branch": run_git(["branch", "--show-current"], cwd),
-        "is_worktree": is_worktree(cwd),
-        "main_repo": get_main_repo_path(cwd) if is_worktree(cwd) else "",
-        "status": run_git(["status", "--short"], cwd),
+        "branch": branch,
+        "is_worktree": in_worktree,
+        "main_repo": get_main_repo_path(cwd) if in_worktree else "",
+        "status": status,
         "recent_commits": run_git(["log", "-3", "--oneline"], cwd),
     }
 
-    # Save to settings.local.json (already gitignored by Claude Code)
-    settings_file = Path(cwd) / ".claude" / "settings.local.json"
+    # Save to its own file (*.local.json is gitignored) rather than merging into
+    # settings.local.json, so we never read-modify-write the user's settings
+    state_file = Path(cwd) / ".claude" / STATE_FILENAME
 
     # If we're in a worktree, save to main repo's .claude directory instead
     # so the state persists even if we accidentally cd to main repo
     if state["is_worktree"] and state["main_repo"]:
-        settings_file = Path(state["main_repo"]) / ".claude" / "settings.local.json"
-
-    settings_file.parent.mkdir(parents=True, exist_ok=True)
+        state_file = Path(state["main_repo"]) / ".claude" / STATE_FILENAME
 
-    # Load existing settings, merge in our state
-    existing = {}
-    if settings_file.exists():
-        try:
-            existing = json.loads(settings_file.read_text())
-        except json.JSONDecodeError:
-            pass
+    state_file.parent.mkdir(parents=True, exist_ok=True)
 
-    existing["worktreeState"] = state
-    settings_file.write_text(json.dumps(existing, indent=2))
+    # Write to a temp file and rename so a concurrent restore never reads a
+    # half-written state
+    tmp_file = state_file.with_name(f".{os.getpid()}.{STATE_FILENAME}")
+    tmp_file.write_text(json.dumps(state, separators=(",", ":")))
+    os.replace(tmp_file, state_file)
 
     sys.exit(0)
 
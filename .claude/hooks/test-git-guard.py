@@ -10,63 +10,75 @@ Tests the ViolationType separation between:
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+HOOK_PATH = str(Path(__file__).resolve().parent / "git-guard.py")
 
-def run_hook(command: str, cwd: str = "/tmp") -> tuple[int, str, str]:
-    """Run the git-guard hook with a command and return (exit_code, stdout, stderr)."""
+CONFIRMATION_VAR = "I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION"
+CONFIRMED = f"{CONFIRMATION_VAR}=yes"
+
+
+def run_hook(command: str, cwd: str = "/tmp") -> tuple[int, bytes, bytes]:
+    """Run the git-guard hook with a command and return (exit_code, stdout, stderr).
+
+    Output stays as raw bytes - every check is an ASCII substring or emptiness
+    test, so there's nothing to gain from decoding it.
+    """
     test_input = {
         "cwd": cwd,
         "tool_input": {"command": command}
     }
 
+    # Hand the child pre-encoded bytes rather than going through text-mode
+    # pipe wrappers
     result = subprocess.run(
-        ["python3", str(Path(__file__).parent / "git-guard.py")],
-        input=json.dumps(test_input),
+        [sys.executable, HOOK_PATH],
+        input=json.dumps(test_input, separators=(",", ":")).encode(),
         capture_output=True,
-        text=True,
     )
 
     return result.returncode, result.stdout, result.stderr
 
 
 class TestResults:
-    def __init__(self):
+    def __init__(self, title: str = ""):
         self.passed = 0
         self.failed = 0
+        # Buffered so concurrently running groups don't interleave their output
+        self.lines = [title] if title else []
 
     def check(self, condition: bool, name: str):
         if condition:
-            print(f"  ✅ {name}")
+            self.lines.append(f"  ✅ {name}")
             self.passed += 1
         else:
-            print(f"  ❌ {name}")
+            self.lines.append(f"  ❌ {name}")
             self.failed += 1
 
 
 def test_needs_confirmation_blocked():
     """Test operations that need confirmation are BLOCKED without flag."""
-    print("\n🚫 Testing NEEDS_CONFIRMATION violations (should exit 2 without flag)")
-    results = TestResults()
+    results = TestResults("\n🚫 Testing NEEDS_CONFIRMATION violations (should exit 2 without flag)")
 
     # git push origin main - blocked
     exit_code, stdout, stderr = run_hook("git push origin main")
     results.check(
-        exit_code == 2 and "BLOCKED" in stderr,
+        exit_code == 2 and b"BLOCKED" in stderr,
         "git push origin main → blocked without confirmation"
     )
 
     # git push origin master - blocked
     exit_code, stdout, stderr = run_hook("git push origin master")
     results.check(
-        exit_code == 2 and "BLOCKED" in stderr,
+        exit_code == 2 and b"BLOCKED" in stderr,
         "git push origin master → blocked without confirmation"
     )
 
     # gh pr merge - blocked
     exit_code, stdout, stderr = run_hook("gh pr merge 123")
     results.check(
-        exit_code == 2 and "BLOCKED" in stderr,
+        exit_code == 2 and b"BLOCKED" in stderr,
         "gh pr merge → blocked without confirmation"
     )
 
@@ -75,35 +87,34 @@ def test_needs_confirmation_blocked():
 
 def test_confirmed_operations():
     """Test that I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes bypasses NEEDS_CONFIRMATION blocks."""
-    print("\n✅ Testing I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes bypass (should exit 0)")
-    results = TestResults()
+    results = TestResults(f"\n✅ Testing {CONFIRMED} bypass (should exit 0)")
 
     # git push origin main with confirmation
-    exit_code, stdout, stderr = run_hook("I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push origin main")
+    exit_code, stdout, stderr = run_hook(f"{CONFIRMED} git push origin main")
     results.check(
         exit_code == 0 and not stderr.strip(),
-        "I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push origin main → allowed"
+        f"{CONFIRMED} git push origin main → allowed"
     )
 
     # git push origin master with confirmation
-    exit_code, stdout, stderr = run_hook("I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push origin master")
+    exit_code, stdout, stderr = run_hook(f"{CONFIRMED} git push origin master")
     results.check(
         exit_code == 0 and not stderr.strip(),
-        "I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push origin master → allowed"
+        f"{CONFIRMED} git push origin master → allowed"
     )
 
     # gh pr merge with confirmation
-    exit_code, stdout, stderr = run_hook("I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes gh pr merge 123")
+    exit_code, stdout, stderr = run_hook(f"{CONFIRMED} gh pr merge 123")
     results.check(
         exit_code == 0 and not stderr.strip(),
-        "I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes gh pr merge → allowed"
+        f"{CONFIRMED} gh pr merge → allowed"
     )
 
     # Refspec with confirmation
-    exit_code, stdout, stderr = run_hook("I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push origin HEAD:main")
+    exit_code, stdout, stderr = run_hook(f"{CONFIRMED} git push origin HEAD:main")
     results.check(
         exit_code == 0 and not stderr.strip(),
-        "I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push origin HEAD:main → allowed"
+        f"{CONFIRMED} git push origin HEAD:main → allowed"
     )
 
     return results
@@ -111,28 +122,27 @@ def test_confirmed_operations():
 
 def test_confirmation_does_not_bypass_hard_blocks():
     """Test that I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes does NOT bypass HARD_BLOCK violations."""
-    print("\n🔒 Testing that confirmation doesn't bypass hard blocks")
-    results = TestResults()
+    results = TestResults("\n🔒 Testing that confirmation doesn't bypass hard blocks")
 
     # git commit -a with confirmation - still blocked
-    exit_code, stdout, stderr = run_hook("I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git commit -a -m 'test'")
+    exit_code, stdout, stderr = run_hook(f"{CONFIRMED} git commit -a -m 'test'")
     results.check(
-        exit_code == 2 and "git commit -a is forbidden" in stderr,
-        "I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git commit -a → still hard blocked"
+        exit_code == 2 and b"git commit -a is forbidden" in stderr,
+        f"{CONFIRMED} git commit -a → still hard blocked"
     )
 
     # git push --no-verify with confirmation - still blocked
-    exit_code, stdout, stderr = run_hook("I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push --no-verify origin main")
+    exit_code, stdout, stderr = run_hook(f"{CONFIRMED} git push --no-verify origin main")
     results.check(
-        exit_code == 2 and "git push --no-verify is forbidden" in stderr,
-        "I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push --no-verify → still hard blocked"
+        exit_code == 2 and b"git push --no-verify is forbidden" in stderr,
+        f"{CONFIRMED} git push --no-verify → still hard blocked"
     )
 
     # git commit --no-verify with confirmation - still blocked
-    exit_code, stdout, stderr = run_hook("I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git commit --no-verify -m 'test'")
+    exit_code, stdout, stderr = run_hook(f"{CONFIRMED} git commit --no-verify -m 'test'")
     results.check(
-        exit_code == 2 and "git commit --no-verify is forbidden" in stderr,
-        "I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git commit --no-verify → still hard blocked"
+        exit_code == 2 and b"git commit --no-verify is forbidden" in stderr,
+        f"{CONFIRMED} git commit --no-verify → still hard blocked"
     )
 
     return results
@@ -140,34 +150,33 @@ def test_confirmation_does_not_bypass_hard_blocks():
 
 def test_hard_block_violations():
     """Test operations that should be hard blocked (exit 2)."""
-    print("\n🚫 Testing HARD_BLOCK violations (should exit 2, never bypassable)")
-    results = TestResults()
+    results = TestResults("\n🚫 Testing HARD_BLOCK violations (should exit 2, never bypassable)")
 
     # git commit -a
     exit_code, _, stderr = run_hook("git commit -a -m 'test'")
     results.check(
-        exit_code == 2 and "git commit -a is forbidden" in stderr,
+        exit_code == 2 and b"git commit -a is forbidden" in stderr,
         "git commit -a → hard blocked"
     )
 
     # git commit -am (combined flags)
     exit_code, _, stderr = run_hook("git commit -am 'test'")
     results.check(
-        exit_code == 2 and "git commit -a is forbidden" in stderr,
+        exit_code == 2 and b"git commit -a is forbidden" in stderr,
         "git commit -am → hard blocked (combined flags)"
     )
 
     # git push --no-verify
     exit_code, _, stderr = run_hook("git push --no-verify origin feature")
     results.check(
-        exit_code == 2 and "git push --no-verify is forbidden" in stderr,
+        exit_code == 2 and b"git push --no-verify is forbidden" in stderr,
         "git push --no-verify → hard blocked"
     )
 
     # git commit --no-verify
     exit_code, _, stderr = run_hook("git commit --no-verify -m 'test'")
     results.check(
-        exit_code == 2 and "git commit --no-verify is forbidden" in stderr,
+        exit_code == 2 and b"git commit --no-verify is forbidden" in stderr,
         "git commit --no-verify → hard blocked"
     )
 
@@ -176,13 +185,12 @@ def test_hard_block_violations():
 
 def test_hard_block_priority():
     """Test that hard blocks take priority over needs-confirmation violations."""
-    print("\n⚡ Testing hard block priority (hard block wins over needs-confirmation)")
-    results = TestResults()
+    results = TestResults("\n⚡ Testing hard block priority (hard block wins over needs-confirmation)")
 
     # git commit -a --no-verify: both are HARD_BLOCK
     exit_code, stdout, stderr = run_hook("git commit -a --no-verify -m 'test'")
     results.check(
-        exit_code == 2 and "forbidden" in stderr,
+        exit_code == 2 and b"forbidden" in stderr,
         "git commit -a --no-verify → hard blocks"
     )
 
@@ -190,15 +198,15 @@ def test_hard_block_priority():
     # Hard block should win
     exit_code, stdout, stderr = run_hook("git push --no-verify origin main")
     results.check(
-        exit_code == 2 and "git push --no-verify is forbidden" in stderr,
+        exit_code == 2 and b"git push --no-verify is forbidden" in stderr,
         "git push --no-verify origin main → hard blocks (--no-verify wins)"
     )
 
     # Even with confirmation, hard block still wins
-    exit_code, stdout, stderr = run_hook("I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push --no-verify origin main")
+    exit_code, stdout, stderr = run_hook(f"{CONFIRMED} git push --no-verify origin main")
     results.check(
-        exit_code == 2 and "git push --no-verify is forbidden" in stderr,
-        "I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push --no-verify → still hard blocked"
+        exit_code == 2 and b"git push --no-verify is forbidden" in stderr,
+        f"{CONFIRMED} git push --no-verify → still hard blocked"
     )
 
     return results
@@ -206,8 +214,7 @@ def test_hard_block_priority():
 
 def test_allowed_operations():
     """Test operations that should be allowed without prompts."""
-    print("\n✅ Testing allowed operations (should exit 0, no output)")
-    results = TestResults()
+    results = TestResults("\n✅ Testing allowed operations (should exit 0, no output)")
 
     # git push to feature branch
     exit_code, stdout, stderr = run_hook("git push origin feature-branch")
@@ -291,27 +298,26 @@ def test_allowed_operations():
 
 def test_refspec_detection():
     """Test detection of main branch in refspecs (blocked without confirmation)."""
-    print("\n🔀 Testing refspec detection (blocked without confirmation)")
-    results = TestResults()
+    results = TestResults("\n🔀 Testing refspec detection (blocked without confirmation)")
 
     # HEAD:main - blocked
     exit_code, stdout, stderr = run_hook("git push origin HEAD:main")
     results.check(
-        exit_code == 2 and "BLOCKED" in stderr,
+        exit_code == 2 and b"BLOCKED" in stderr,
         "git push origin HEAD:main → blocked without confirmation"
     )
 
     # feature:master - blocked
     exit_code, stdout, stderr = run_hook("git push origin feature:master")
     results.check(
-        exit_code == 2 and "BLOCKED" in stderr,
+        exit_code == 2 and b"BLOCKED" in stderr,
         "git push origin feature:master → blocked without confirmation"
     )
 
     # +main (force push) - blocked
     exit_code, stdout, stderr = run_hook("git push origin +main")
     results.check(
-        exit_code == 2 and "BLOCKED" in stderr,
+        exit_code == 2 and b"BLOCKED" in stderr,
         "git push origin +main → blocked without confirmation"
     )
 
@@ -327,18 +333,17 @@ def test_refspec_detection():
 
 def test_confirmation_flag_parsing():
     """Test various formats of the confirmation flag."""
-    print("\n🔧 Testing confirmation flag parsing")
-    results = TestResults()
+    results = TestResults("\n🔧 Testing confirmation flag parsing")
 
     # Standard format
-    exit_code, _, _ = run_hook("I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push origin main")
-    results.check(exit_code == 0, "I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push origin main → allowed")
+    exit_code, _, _ = run_hook(f"{CONFIRMED} git push origin main")
+    results.check(exit_code == 0, f"{CONFIRMED} git push origin main → allowed")
 
     # Wrong value (should not work)
-    exit_code, _, stderr = run_hook("I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=no git push origin main")
+    exit_code, _, stderr = run_hook(f"{CONFIRMATION_VAR}=no git push origin main")
     results.check(
         exit_code == 2,
-        "I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=no git push origin main → blocked (wrong value)"
+        f"{CONFIRMATION_VAR}=no git push origin main → blocked (wrong value)"
     )
 
     # Other env var (should not work)
@@ -350,45 +355,45 @@ def test_confirmation_flag_parsing():
 
     # Flag in wrong position - git parses this as subcommand "I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes"
     # which is invalid and will fail anyway. Hook allows it through (not a push to main).
-    exit_code, _, stderr = run_hook("git I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes push origin main")
+    exit_code, _, stderr = run_hook(f"git {CONFIRMED} push origin main")
     results.check(
         exit_code == 0,
-        "git I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes push ... → allowed (malformed, git will reject)"
+        f"git {CONFIRMED} push ... → allowed (malformed, git will reject)"
     )
 
     # Multiple env vars with confirmation first
-    exit_code, _, _ = run_hook("I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes FOO=bar git push origin main")
+    exit_code, _, _ = run_hook(f"{CONFIRMED} FOO=bar git push origin main")
     results.check(
         exit_code == 0,
-        "I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes FOO=bar git push origin main → allowed"
+        f"{CONFIRMED} FOO=bar git push origin main → allowed"
     )
 
     # cd && ... prefix (common for worktrees)
-    exit_code, _, _ = run_hook("cd /repo && I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push origin main")
+    exit_code, _, _ = run_hook(f"cd /repo && {CONFIRMED} git push origin main")
     results.check(
         exit_code == 0,
-        "cd /repo && I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push origin main → allowed"
+        f"cd /repo && {CONFIRMED} git push origin main → allowed"
     )
 
     # Confirmation after command separator
-    exit_code, _, _ = run_hook("cd /tmp ; I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push origin master")
+    exit_code, _, _ = run_hook(f"cd /tmp ; {CONFIRMED} git push origin master")
     results.check(
         exit_code == 0,
-        "cd /tmp ; I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes git push → allowed (semicolon separator)"
+        f"cd /tmp ; {CONFIRMED} git push → allowed (semicolon separator)"
     )
 
     # Security test: flag AFTER command (suffix bypass attempt) should be blocked
-    exit_code, _, stderr = run_hook("gh pr merge 123 I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes")
+    exit_code, _, stderr = run_hook(f"gh pr merge 123 {CONFIRMED}")
     results.check(
         exit_code == 2,
-        "gh pr merge 123 I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes → blocked (suffix bypass attempt)"
+        f"gh pr merge 123 {CONFIRMED} → blocked (suffix bypass attempt)"
     )
 
     # Same for git
-    exit_code, _, stderr = run_hook("git push origin main I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes")
+    exit_code, _, stderr = run_hook(f"git push origin main {CONFIRMED}")
     results.check(
         exit_code == 2,
-        "git push origin main I_FOLLOWED_THE_INSTRUCTIONS_ABOUT_PUSHING_TO_MAIN_AND_I_HAVE_PERMISSION=yes → blocked (suffix bypass attempt)"
+        f"git push origin main {CONFIRMED} → blocked (suffix bypass attempt)"
     )
 
     return results
@@ -400,7 +405,7 @@ if __name__ == "__main__":
 
     all_results = TestResults()
 
-    for test_fn in [
+    test_fns = [
         test_needs_confirmation_blocked,
         test_confirmed_operations,
         test_confirmation_does_not_bypass_hard_blocks,
@@ -409,10 +414,15 @@ if __name__ == "__main__":
         test_allowed_operations,
         test_refspec_detection,
         test_confirmation_flag_parsing,
-    ]:
-        results = test_fn()
-        all_results.passed += results.passed
-        all_results.failed += results.failed
+    ]
+
+    # Each group just waits on hook subprocesses, so run them concurrently and
+    # report in the original order
+    with ThreadPoolExecutor(max_workers=len(test_fns)) as executor:
+        for results in executor.map(lambda test_fn: test_fn(), test_fns):
+            sys.stdout.write("\n".join(results.lines) + "\n")
+            all_results.passed += results.passed
+            all_results.failed += results.failed
 
     print("\n" + "=" * 60)
     print(f"Results: {all_results.passed} passed, {all_results.failed} failed")